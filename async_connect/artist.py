@@ -50,7 +50,7 @@ class Artist:
 
     __slots__ = (
         'id', 'name', 'vanity_uri', 'profile_image_id', 'profile_image_url', 'about',
-        'bookings', 'management_detail', 'urls', 'years', '_releases', '_loop', '_http'
+        'bookings', 'management_detail', 'urls', 'years', '_loop', '_http'
     )
 
     def __init__(self, **kwargs):
@@ -83,6 +83,12 @@ class Artist:
         Use 'await artist.releases.values()' to get a list instead of an asynchronous iterator."""
         return ArtistIterator(self.id, loop=self._loop, http=self._http)
 
+    def iter_releases(self, *, page_size: int = 50):
+        """Returns an AsyncIterator that requests the releases in pages of the given size.
+
+        The next page is only requested once the releases of the current one have been consumed."""
+        return ArtistIterator(self.id, page_size=page_size, loop=self._loop, http=self._http)
+
 
 class ArtistEntry:
     """Represents an artist entry from a track.
@@ -25,8 +25,9 @@ SOFTWARE.
 """
 
 import asyncio
-from typing import List, Tuple
-from urllib.parse import quote
+import copy
+import sys
+from typing import Dict, List, Tuple
 
 from .artist import Artist
 from .errors import NotFound
@@ -34,13 +35,27 @@ from .http import HTTPClient
 from .playlist import Playlist
 from .release import Release
 from .track import Track, BrowseEntry
-from .utils import find
+from .utils import get_event_loop, get_running_loop
 
 
 class Client:
-    def __init__(self, *, loop=None):
-        self.loop = loop or asyncio.get_event_loop()
-        self.http = HTTPClient(loop=self.loop)
+    def __init__(self, *, loop=None, use_uvloop: bool = False, eager_tasks: bool = False, connector=None, cache_ttl: float = None,
+                 cache_size: int = 256):
+        # the policy only affects loops created from now on, so a running loop can't be switched to uvloop
+        if use_uvloop and loop is None and sys.platform != 'win32' and get_running_loop() is None:
+            try:
+                import uvloop
+            except ImportError:
+                pass
+            else:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        self.loop = loop or get_event_loop()
+        # Python 3.12+: run gathered coroutines eagerly so the ones that finish
+        # without suspending don't need to be scheduled as tasks at all.
+        if eager_tasks and hasattr(asyncio, 'eager_task_factory') and self.loop.get_task_factory() is None:
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        self.http = HTTPClient(loop=self.loop, connector=connector, cache_ttl=cache_ttl, cache_size=cache_size)
+        self._browse_filters = None
         self._is_closed = False
 
     async def sign_in(self, email: str, password: str, token: int = None):
@@ -118,11 +133,11 @@ class Client:
         """
         if entries:
             json_entries = []
-            for entry in entries:
-                if find(lambda a: a.id == entry[1].id, entry[0].albums):
-                    json_entries.append({'trackId': entry[0].id, 'releaseId': entry[1].id})
+            for track, release in entries:
+                if track.in_release(release):
+                    json_entries.append({'trackId': track.id, 'releaseId': release.id})
                 else:
-                    raise ValueError(f'The track "{entry[0]}" is not in the release\'s "{entry[1]}" track list.')
+                    raise ValueError(f'The track "{track}" is not in the release\'s "{release}" track list.')
 
             return Playlist(loop=self.loop, http=self.http, **await self.http.create_playlist(name=name, public=public, entries=json_entries))
         else:
@@ -202,7 +217,7 @@ class Client:
         Playlist
             The playlist with the track that was added.
         """
-        if find(lambda a: a.id == release.id, track.albums):
+        if track.in_release(release):
             return Playlist(loop=self.loop, http=self.http, **await self.http.add_playlist_track(playlist_id=playlist.id, track_id=track.id, release_id=release.id))
         else:
             raise ValueError(f'The track "{track}" is not in the release\'s "{release}" track list.')
@@ -232,11 +247,11 @@ class Client:
             The playlist with the tracks that were added.
         """
         json_entries = []
-        for entry in entries:
-            if find(lambda a: a.id == entry[1].id, entry[0].albums):
-                json_entries.append({'trackId': entry[0].id, 'releaseId': entry[1].id})
+        for track, release in entries:
+            if track.in_release(release):
+                json_entries.append({'trackId': track.id, 'releaseId': release.id})
             else:
-                raise ValueError(f'The track "{entry[0]}" is not in the release\'s "{entry[1]}" track list.')
+                raise ValueError(f'The track "{track}" is not in the release\'s "{release}" track list.')
         return Playlist(loop=self.loop, http=self.http, **await self.http.add_playlist_tracks(playlist_id=playlist.id, entries=json_entries))
 
     async def add_reddit_username(self, username: str):
@@ -298,7 +313,14 @@ class Client:
         return Playlist(loop=self.loop, http=self.http, **await self.http.delete_playlist_track(playlist_id=playlist.id, track_id=track.id))
 
     async def get_browse_filters(self) -> dict:
-        return await self.http.request('GET', self.http.BROWSE_FILTERS)
+        """This function is a coroutine.
+
+        Returns the filters that can be used with :meth:`connect.Client.get_browse_entries`.
+        They are requested only once and kept for the lifetime of the client, every call returns its own copy.
+        """
+        if self._browse_filters is None:
+            self._browse_filters = await self.http.request('GET', self.http.BROWSE_FILTERS)
+        return copy.deepcopy(self._browse_filters)
 
     async def get_discord_invite(self) -> str:
         """This function is a coroutine.
@@ -335,6 +357,30 @@ class Client:
         """
         return Release(loop=self.loop, http=self.http, **await self.http.get_release(catalog_id))
 
+    async def get_releases(self, catalog_ids: List[str]) -> Dict[str, Release]:
+        """This function is a coroutine.
+
+        Returns the releases with the given IDs. The releases are requested concurrently.
+
+        Parameters
+        ----------
+        catalog_ids: List[str]
+           The ids of the releases that the client should get.
+
+        Raises
+        ------
+        NotFound
+            The client couldn't get one of the releases.
+
+        Returns
+        -------
+        Dict[str, Release]
+            Releases that were requested mapped by the ID/catalog ID they were requested with.
+        """
+        catalog_ids = list(dict.fromkeys(catalog_ids))
+        releases = await asyncio.gather(*[self.get_release(catalog_id) for catalog_id in catalog_ids])
+        return dict(zip(catalog_ids, releases))
+
     async def get_track(self, track_id: str) -> Track:
         """This function is a coroutine.
 
@@ -404,7 +450,26 @@ class Client:
         """
         return Playlist(loop=self.loop, http=self.http, **await self.http.get_playlist(playlist_id))
 
-    async def get_all_releases(self, *, singles: bool = True, eps: bool = True, albums: bool = True, podcasts: bool = False, limit: int = None, skip: int = None) -> List[Release]:
+    def _connection_semaphore(self) -> asyncio.Semaphore:
+        # keeps concurrent requests within the pool so they don't wait on the connector, which counts against their timeout
+        connector = self.http.session.connector
+        # aiohttp uses 0 for no limit
+        return asyncio.Semaphore(connector.limit_per_host or connector.limit or sys.maxsize)
+
+    async def _get_all_pages(self, fetch, page_size: int, **kwargs) -> list:
+        # the first page tells how many entries there are, the rest are requested at the same time
+        first = await fetch(limit=page_size, skip=0, **kwargs)
+        semaphore = self._connection_semaphore()
+
+        async def fetch_page(skip):
+            async with semaphore:
+                return (await fetch(limit=page_size, skip=skip, **kwargs))['results']
+
+        pages = await asyncio.gather(*[fetch_page(skip) for skip in range(page_size, first['total'], page_size)])
+        return first['results'] + [entry for page in pages for entry in page]
+
+    async def get_all_releases(self, *, singles: bool = True, eps: bool = True, albums: bool = True, podcasts: bool = False, limit: int = None, skip: int = None,
+                               page_size: int = None) -> List[Release]:
         """This function is a coroutine.
 
         Retrieves every release the client can access.
@@ -423,18 +488,63 @@ class Client:
            The limit for how many tracks are supposed to be shown.
         skip: int
            Number of tracks that are skipped to be shown.
+        page_size: int
+           If given, every release is requested in pages of this size that are fetched concurrently.
+           ``limit`` and ``skip`` are ignored in that case.
 
         Returns
         -------
         List[Release]
             All the singles/eps/albums/podcasts (depends how you set the parameters) that are available.
         """
-        releases = []
-        for release in (await self.http.get_all_releases(singles=singles, eps=eps, albums=albums, podcasts=podcasts, limit=limit, skip=skip))['results']:
-            releases.append(Release(loop=self.loop, http=self.http, **release))
-        return releases
+        if page_size:
+            results = await self._get_all_pages(self.http.get_all_releases, page_size, singles=singles, eps=eps, albums=albums, podcasts=podcasts)
+        else:
+            results = (await self.http.get_all_releases(singles=singles, eps=eps, albums=albums, podcasts=podcasts, limit=limit, skip=skip))['results']
+        return [Release(loop=self.loop, http=self.http, **release) for release in results]
+
+    async def get_all_releases_with_tracks(self, *, singles: bool = True, eps: bool = True, albums: bool = True, podcasts: bool = False,
+                                           limit: int = None, skip: int = None, page_size: int = None) -> List[Tuple[Release, List[Track]]]:
+        """This function is a coroutine.
+
+        Retrieves every release the client can access together with their tracklists.
+        The tracklists are requested concurrently.
+
+        Parameters
+        ----------
+        singles: bool
+           If the client should get singles.
+        eps: bool
+           If the client should get EPs.
+        albums: bool
+           If the client should get albums.
+        podcasts: bool
+           If the client should get podcasts.
+        limit: int
+           The limit for how many releases are supposed to be shown.
+        skip: int
+           Number of releases that are skipped to be shown.
+        page_size: int
+           If given, every release is requested in pages of this size that are fetched concurrently.
+           ``limit`` and ``skip`` are ignored in that case.
+
+        Returns
+        -------
+        List[Tuple[Release, List[Track]]]
+            All the singles/eps/albums/podcasts (depends how you set the parameters) that are available paired with their tracks.
+        """
+        releases = await self.get_all_releases(singles=singles, eps=eps, albums=albums, podcasts=podcasts, limit=limit, skip=skip,
+                                               page_size=page_size)
+        semaphore = self._connection_semaphore()
+
+        async def fetch_tracks(release):
+            async with semaphore:
+                return await release.tracks.values()
+
+        tracklists = await asyncio.gather(*[fetch_tracks(release) for release in releases])
+        return list(zip(releases, tracklists))
 
-    async def get_all_tracks(self, *, limit: int = None, skip: int = None) -> List[Track]:
+    async def get_all_tracks(self, *, limit: int = None, skip: int = None, page_size: int = None) -> List[Track]:
         """This function is a coroutine.
 
         Retrieves every track the client can access.
@@ -445,18 +555,22 @@ class Client:
            Limit for how many tracks are supposed to be shown.
         skip: int
            Number of tracks that are skipped to be shown.
+        page_size: int
+           If given, every track is requested in pages of this size that are fetched concurrently.
+           ``limit`` and ``skip`` are ignored in that case.
 
         Returns
         -------
         List[Track]
             All the tracks that are available.
         """
-        tracks = []
-        for track in (await self.http.get_all_tracks(limit=limit, skip=skip))['results']:
-            tracks.append(Track(**track))
-        return tracks
+        if page_size:
+            results = await self._get_all_pages(self.http.get_all_tracks, page_size)
+        else:
+            results = (await self.http.get_all_tracks(limit=limit, skip=skip))['results']
+        return [Track(**track) for track in results]
 
-    async def get_all_artists(self, *, year: int = None, limit: int = None, skip: int = None) -> List[Artist]:
+    async def get_all_artists(self, *, year: int = None, limit: int = None, skip: int = None, page_size: int = None) -> List[Artist]:
         """This function is a coroutine.
 
         Retrieves every artist the client can access.
@@ -469,18 +583,22 @@ class Client:
            Limit for how many artists are supposed to be shown.
         skip: int
            Number of artists that are skipped to be shown.
+        page_size: int
+           If given, every artist is requested in pages of this size that are fetched concurrently.
+           ``limit`` and ``skip`` are ignored in that case.
 
         Returns
         -------
         List[Artist]
             All the artists that are available.
         """
-        artists = []
-        for artist in (await self.http.get_all_artists(year=year, limit=limit, skip=skip))['results']:
-            artists.append(Artist(loop=self.loop, http=self.http, **artist))
-        return artists
+        if page_size:
+            results = await self._get_all_pages(self.http.get_all_artists, page_size, year=year)
+        else:
+            results = (await self.http.get_all_artists(year=year, limit=limit, skip=skip))['results']
+        return [Artist(loop=self.loop, http=self.http, **artist) for artist in results]
 
-    async def get_all_playlists(self, *, limit: int = None, skip: int = None) -> List[Playlist]:
+    async def get_all_playlists(self, *, limit: int = None, skip: int = None, page_size: int = None) -> List[Playlist]:
         """This function is a coroutine.
 
         Retrieves every playlist the client can access.
@@ -491,6 +609,9 @@ class Client:
            Limit for how many playlists are supposed to be shown.
         skip: int
            Number of playlists that are skipped to be shown.
+        page_size: int
+           If given, every playlist is requested in pages of this size that are fetched concurrently.
+           ``limit`` and ``skip`` are ignored in that case.
 
         Raises
         ------
@@ -502,16 +623,17 @@ class Client:
         List[Playlist]
            All the playlists that the account has.
         """
-        playlists = []
-        for playlist in (await self.http.get_all_playlists(limit=limit, skip=skip))['results']:
-            playlists.append(Playlist(loop=self.loop, http=self.http, **playlist))
-        return playlists
+        if page_size:
+            results = await self._get_all_pages(self.http.get_all_playlists, page_size)
+        else:
+            results = (await self.http.get_all_playlists(limit=limit, skip=skip))['results']
+        return [Playlist(loop=self.loop, http=self.http, **playlist) for playlist in results]
 
     async def get_browse_entries(self, *, types: List[str] = None, genres: List[str] = None, tags: List[str] = None, limit: int = None, skip: int = None) -> List[BrowseEntry]:
         # I can't think of a better way to name this function...
         """This function is a coroutine.
 
-        Check `connect.Client.browse_filters` for filters that are needed to be used on the function's parameters.
+        Check `connect.Client.get_browse_filters` for filters that are needed to be used on the function's parameters.
 
         Parameters
         ----------
@@ -536,13 +658,10 @@ class Client:
         List[BrowseEntry]
             List of browse entries that the API could find with the given filters.
         """
-        entries = []
-        for entry in (await self.http.get_browse_entries(types=types, genres=genres, tags=tags, limit=limit, skip=skip))['results']:
-            entries.append(BrowseEntry(**entry))
-        if not entries:
+        results = (await self.http.get_browse_entries(types=types, genres=genres, tags=tags, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No browse entry was found.')
-        else:
-            return entries
+        return [BrowseEntry(**entry) for entry in results]
 
     async def search_release(self, term: str, *, limit: int = None, skip: int = None) -> List[Release]:
         """This function is a coroutine.
@@ -568,13 +687,10 @@ class Client:
         List[Release]
             List of releases that the API could find.
         """
-        releases = []
-        for release in (await self.http.request('GET', f'{self.http.RELEASE}?fuzzyOr=title,{quote(term)},renderedArtists,{quote(term)}&limit={limit}&skip={skip}'))['results']:
-            releases.append(Release(loop=self.loop, http=self.http, **release))
-        if not releases:
+        results = (await self.http.search_release(term, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No release was found.')
-        else:
-            return releases
+        return [Release(loop=self.loop, http=self.http, **release) for release in results]
 
     async def search_release_advanced(self, title: str, artists: str, *, limit: int = None, skip: int = None) -> List[Release]:
         """This function is a coroutine.
@@ -602,13 +718,10 @@ class Client:
         List[Release]
             List of releases that the API could find.
         """
-        releases = []
-        for release in (await self.http.request('GET', f'{self.http.RELEASE}?fuzzy=title,{quote(title)},renderedArtists,{quote(artists)}&limit={limit}&skip={skip}'))['results']:
-            releases.append(Release(loop=self.loop, http=self.http, **release))
-        if not releases:
+        results = (await self.http.search_release_advanced(title, artists, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No release was found.')
-        else:
-            return releases
+        return [Release(loop=self.loop, http=self.http, **release) for release in results]
 
     async def search_track(self, term: str, *, limit: int = None, skip: int = None) -> List[Track]:
         """This function is a coroutine.
@@ -634,13 +747,10 @@ class Client:
         List[Track]
             List of tracks that the API could find.
         """
-        tracks = []
-        for track in (await self.http.request('GET', f'{self.http.TRACK}?fuzzyOr=title,{quote(term)},artistsTitle,{quote(term)}&limit={limit}&skip={skip}'))['results']:
-            tracks.append(Track(**track))
-        if not tracks:
+        results = (await self.http.search_track(term, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No track was found.')
-        else:
-            return tracks
+        return [Track(**track) for track in results]
 
     async def search_track_advanced(self, title: str, artists: str, *, limit: int = None, skip: int = None) -> List[Track]:
         """This function is a coroutine.
@@ -668,13 +778,10 @@ class Client:
         List[Track]
             List of tracks that the API could find.
         """
-        tracks = []
-        for track in (await self.http.request('GET', f'{self.http.TRACK}?fuzzy=title,{quote(title)},artistsTitle,{quote(artists)}&limit={limit}&skip={skip}'))['results']:
-            tracks.append(Track(**track))
-        if not tracks:
+        results = (await self.http.search_track_advanced(title, artists, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No track was found.')
-        else:
-            return tracks
+        return [Track(**track) for track in results]
 
     async def search_artist(self, term: str, *, year: int = None, limit: int = None, skip: int = None) -> List[Artist]:
         """This function is a coroutine.
@@ -702,16 +809,10 @@ class Client:
         List[Artist]
             List of artists that the API could find.
         """
-        artists = []
-        base = f'{self.http.ARTIST}?limit={limit}&skip={skip}&fuzzyOr=name,{quote(term)}'
-        if year:
-            base = f'{base},year,{year}'
-        for artist in (await self.http.request('GET', base))['results']:
-            artists.append(Artist(loop=self.loop, http=self.http, **artist))
-        if not artists:
+        results = (await self.http.search_artist(term, year=year, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No artist was found.')
-        else:
-            return artists
+        return [Artist(loop=self.loop, http=self.http, **artist) for artist in results]
 
     async def search_playlist(self, term: str, *, limit: int = None, skip: int = None) -> List[Playlist]:
         """This function is a coroutine.
@@ -739,10 +840,7 @@ class Client:
         List[Playlist]
             List of playlists that the API could find.
         """
-        playlists = []
-        for playlist in (await self.http.request('GET', f'{self.http.PLAYLIST}?fuzzyOr=name,{quote(term)}&limit={limit}&skip={skip}'))['results']:
-            playlists.append(Playlist(loop=self.loop, http=self.http, **playlist))
-        if not playlists:
+        results = (await self.http.search_playlist(term, limit=limit, skip=skip))['results']
+        if not results:
             raise NotFound('No playlist was found.')
-        else:
-            return playlists
+        return [Playlist(loop=self.loop, http=self.http, **playlist) for playlist in results]
@@ -25,19 +25,36 @@ SOFTWARE.
 """
 
 import asyncio
+import copy
+import functools
 import re
 import sys
+import time
+from collections import OrderedDict
 
 import aiohttp
 
-try:
-    import ujson as json
-except ImportError:
-    import json
-
 from .errors import HTTPSException, Unauthorized, Forbidden, NotFound
 from . import utils, __version__
 
+_FILENAME_RE = re.compile('filename=(.+)')
+
+_STATUS_EXCEPTIONS = {
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound
+}
+
+
+class _InflightRequest:
+    __slots__ = ('generation', 'task', 'waiters', 'shared')
+
+    def __init__(self, generation, task):
+        self.generation = generation
+        self.task = task
+        self.waiters = 0
+        self.shared = False
+
 
 class HTTPClient:
     BASE = 'https://connect.monstercat.com'
@@ -53,60 +70,106 @@ class HTTPClient:
     BROWSE = CATALOG + '/browse'
     BROWSE_FILTERS = BROWSE + '/filters'
 
-    def __init__(self, *, loop=None):
-        self.loop = loop or asyncio.get_event_loop()
-        self.session = aiohttp.ClientSession(loop=self.loop)
+    def __init__(self, *, loop=None, connector=None, cache_ttl=None, cache_size=256):
+        self.loop = loop or utils.get_event_loop()
         self.download_link_gen = utils.DownloadLinkGenerator()
         user_agent = 'AsyncConnectBot (https://github.com/GiovanniMCMXCIX/async-connect.py {0}) ' \
                      'Python/{1[0]}.{1[1]} aiohttp/{2}'
         self.user_agent = user_agent.format(__version__, sys.version_info, aiohttp.__version__)
+        if connector is None:
+            # every request goes to the same host, so keep a warm pool of connections around
+            # for longer than aiohttp's default 15 seconds to avoid redoing the TLS handshake.
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60, ttl_dns_cache=300,
+                                             enable_cleanup_closed=True, loop=self.loop)
+        self.session = aiohttp.ClientSession(loop=self.loop, connector=connector, headers={'User-Agent': self.user_agent},
+                                             json_serialize=utils.to_json)
+        self._inflight = {}
+        self._generation = 0
+        self._cache = OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
 
     async def request(self, method, url, **kwargs):
-        headers = {
-            'User-Agent': self.user_agent
-        }
+        if 'params' in kwargs:
+            kwargs['params'] = {key: str(value) for key, value in kwargs['params'].items() if value is not None}
 
-        if 'json' in kwargs:
-            headers['Content-Type'] = 'application/json'
-            kwargs['data'] = utils.to_json(kwargs.pop('json'))
-
-        kwargs['headers'] = headers
+        if method != 'GET' or kwargs.keys() - {'params'}:
+            # anything that isn't a plain GET may change what the API returns, so GETs that started
+            # before it finished are neither joined nor cached
+            self._invalidate()
+            try:
+                return await self._request(method, url, **kwargs)
+            finally:
+                self._invalidate()
+
+        key = (url, frozenset(kwargs.get('params', {}).items()))
+        if key in self._cache:
+            timestamp, data = self._cache[key]
+            if time.monotonic() - timestamp < self._cache_ttl:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(data)
+            del self._cache[key]
+
+        # identical GET requests that are already in flight share a single round trip
+        inflight = self._inflight.get(key)
+        if inflight is None or inflight.generation != self._generation:
+            task = self.loop.create_task(self._request(method, url, **kwargs))
+            inflight = self._inflight[key] = _InflightRequest(self._generation, task)
+            task.add_done_callback(functools.partial(self._finish_inflight, key, inflight))
+        inflight.shared = inflight.shared or inflight.waiters > 0
+        inflight.waiters += 1
+        try:
+            data = await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            # the request is only abandoned once nobody is waiting for it anymore
+            if not inflight.waiters and not inflight.task.done():
+                inflight.task.cancel()
+        # a result that is cached or handed to several waiters is copied, so changing it can't leak to other callers
+        return copy.deepcopy(data) if self._cache_ttl or inflight.shared else data
+
+    def _invalidate(self):
+        self._generation += 1
+        self._cache.clear()
+
+    def _finish_inflight(self, key, inflight, task):
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+
+        if self._cache_ttl and not task.cancelled() and task.exception() is None and inflight.generation == self._generation:
+            self._cache[key] = (time.monotonic(), task.result())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    async def _request(self, method, url, **kwargs):
         async with self.session.request(method, url, **kwargs) as response:
-            text = await response.text()
+            raw = await response.read()
             try:
-                data = json.loads(text)
-            except json.decoder.JSONDecodeError:
-                data = {'message': text} if text else None
+                data = utils.from_json(raw)
             except ValueError:
+                text = raw.decode('utf-8', 'replace')
                 data = {'message': text} if text else None
 
             if 300 > response.status >= 200:
                 return data
-            elif response.status == 401:
-                raise Unauthorized(data.pop('message', 'Unknown error'))
-            elif response.status == 403:
-                raise Forbidden(data.pop('message', 'Unknown error'))
-            elif response.status == 404:
-                raise NotFound(data.pop('message', 'Unknown error'))
-            else:
-                raise HTTPSException(data.pop('message', 'Unknown error'), response)
+
+            message = data.pop('message', 'Unknown error') if isinstance(data, dict) else 'Unknown error'
+            error = _STATUS_EXCEPTIONS.get(response.status)
+            if error is None:
+                raise HTTPSException(message, response)
+            raise error(message)
 
     async def download(self, url, path, chunk_size=4096, **kwargs):
         filename = kwargs.pop('filename', None)
-        kwargs['headers'] = {'User-Agent': self.user_agent}
         async with self.session.request('GET', url, **kwargs) as response:
             async def raise_error(error, resp, use_resp=False):
                 text = await resp.text()
                 try:
                     if use_resp:
-                        raise error(json.loads(text).pop('message', 'Unknown error'), response)
-                    else:
-                        raise error(json.loads(text).pop('message', 'Unknown error'))
-                except json.decoder.JSONDecodeError:
-                    if use_resp:
-                        raise error({'message': text} if text else 'Unknown error', response)
+                        raise error(utils.from_json(text).pop('message', 'Unknown error'), response)
                     else:
-                        raise error({'message': text} if text else 'Unknown error')
+                        raise error(utils.from_json(text).pop('message', 'Unknown error'))
                 except ValueError:
                     if use_resp:
                         raise error({'message': text} if text else 'Unknown error', response)
@@ -115,7 +178,7 @@ class HTTPClient:
 
             if 300 > response.status >= 200:
                 if not filename:
-                    filename = str.replace(re.findall("filename=(.+)", response.headers['content-disposition'])[0], "\"", "")
+                    filename = str.replace(_FILENAME_RE.findall(response.headers['content-disposition'])[0], "\"", "")
                 with open(f'{path}/{filename}', 'wb') as file:
                     while True:
                         chunk = await response.content.read(chunk_size)
@@ -123,16 +186,15 @@ class HTTPClient:
                             break
                         file.write(chunk)
                 return True
-            elif response.status == 401:
-                raise_error(Unauthorized, response)
-            elif response.status == 403:
-                raise_error(Forbidden, response)
-            elif response.status == 404:
-                raise_error(NotFound, response)
-            else:
-                raise_error(HTTPSException, response, True)
+
+            error = _STATUS_EXCEPTIONS.get(response.status)
+            if error is None:
+                await raise_error(HTTPSException, response, True)
+            await raise_error(error, response)
 
     async def close(self):
+        for inflight in list(self._inflight.values()):
+            inflight.task.cancel()
         await self.session.close()
 
     async def email_sign_in(self, email, password):
@@ -190,14 +252,13 @@ class HTTPClient:
 
     async def add_playlist_track(self, playlist_id, track_id, release_id):
         playlist = await self.get_playlist(playlist_id)
-        playlist['tracks'].append({'trackId': track_id, 'releaseId': release_id})
-        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=playlist)
+        payload = dict(playlist, tracks=playlist['tracks'] + [{'trackId': track_id, 'releaseId': release_id}])
+        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=payload)
 
     async def add_playlist_tracks(self, playlist_id, entries):
         playlist = await self.get_playlist(playlist_id)
-        for entry in entries:
-            playlist['tracks'].append(entry)
-        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=playlist)
+        payload = dict(playlist, tracks=playlist['tracks'] + list(entries))
+        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=payload)
 
     async def add_reddit_username(self, username):
         payload = {
@@ -211,8 +272,10 @@ class HTTPClient:
     async def delete_playlist_track(self, playlist_id, track_id):
         playlist = await self.get_playlist(playlist_id)
         track = [item for item in playlist['tracks'] if item['trackId'] == track_id][0]
-        del playlist['tracks'][playlist['tracks'].index(track)]
-        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=playlist)
+        tracks = list(playlist['tracks'])
+        tracks.remove(track)
+        payload = dict(playlist, tracks=tracks)
+        return await self.request('PUT', f'{self.PLAYLIST}/{playlist_id}', json=payload)
 
     async def download_release(self, album_id, path, audio_format, chunk_size=8192):
         return await self.download(self.download_link_gen.release(album_id, audio_format), path, chunk_size=chunk_size)
@@ -241,8 +304,8 @@ class HTTPClient:
     async def get_artist(self, artist_id):
         return await self.request('GET', f'{self.ARTIST}/{artist_id}')
 
-    async def get_artist_releases(self, artist_id):
-        return await self.request('GET', f'{self.ARTIST}/{artist_id}/releases')
+    async def get_artist_releases(self, artist_id, *, limit=None, skip=None):
+        return await self.request('GET', f'{self.ARTIST}/{artist_id}/releases', params={'limit': limit, 'skip': skip})
 
     async def get_playlist(self, playlist_id):
         return await self.request('GET', f'{self.PLAYLIST}/{playlist_id}')
@@ -251,14 +314,14 @@ class HTTPClient:
         return await self.request('GET', f'{self.PLAYLIST}/{playlist_id}/tracks')
 
     async def get_browse_entries(self, *, types=None, genres=None, tags=None, limit=None, skip=None):
-        query = []
-        if types:
-            query.append(f'&types={",".join(types)}')
-        if genres:
-            query.append(f'&genres={",".join(genres)}')
-        if tags:
-            query.append(f'&tags={",".join(tags)}')
-        return await self.request('GET', f'{self.BROWSE}?limit={limit}&skip={skip}{"".join(query)}')
+        params = {
+            'limit': limit,
+            'skip': skip,
+            'types': ','.join(types) if types else None,
+            'genres': ','.join(genres) if genres else None,
+            'tags': ','.join(tags) if tags else None
+        }
+        return await self.request('GET', self.BROWSE, params=params)
 
     async def get_all_releases(self, *, singles=True, eps=True, albums=True, podcasts=False, limit=None, skip=None):
         query = []
@@ -271,18 +334,48 @@ class HTTPClient:
         if podcasts:
             query.append('type,Podcast')
         if not singles and not eps and not albums and not podcasts:
-            return await self.request('GET', f'{self.RELEASE}?fuzzyOr=type,None')
+            return await self.request('GET', self.RELEASE, params={'fuzzyOr': 'type,None'})
         else:
-            return await self.request('GET', f'{self.RELEASE}?fuzzyOr={",".join(query)}&limit={limit}&skip={skip}')
+            return await self.request('GET', self.RELEASE, params={'fuzzyOr': ','.join(query), 'limit': limit, 'skip': skip})
 
     async def get_all_tracks(self, limit=None, skip=None):
-        return await self.request('GET', f'{self.TRACK}?limit={limit}&skip{skip}')
+        return await self.request('GET', self.TRACK, params={'limit': limit, 'skip': skip})
 
     async def get_all_artists(self, year=None, limit=None, skip=None):
-        base = f'{self.ARTIST}?limit={limit}&skip={skip}'
-        if year:
-            base = f'{base}&fuzzy=year,{year}'
-        return await self.request('GET', base)
+        params = {
+            'limit': limit,
+            'skip': skip,
+            'fuzzy': f'year,{year}' if year else None
+        }
+        return await self.request('GET', self.ARTIST, params=params)
 
     async def get_all_playlists(self, *, limit=None, skip=None):
-        return await self.request('GET', f'{self.PLAYLIST}?limit={limit}&skip={skip}')
+        return await self.request('GET', self.PLAYLIST, params={'limit': limit, 'skip': skip})
+
+    async def search_release(self, term, *, limit=None, skip=None):
+        params = {'fuzzyOr': f'title,{term},renderedArtists,{term}', 'limit': limit, 'skip': skip}
+        return await self.request('GET', self.RELEASE, params=params)
+
+    async def search_release_advanced(self, title, artists, *, limit=None, skip=None):
+        params = {'fuzzy': f'title,{title},renderedArtists,{artists}', 'limit': limit, 'skip': skip}
+        return await self.request('GET', self.RELEASE, params=params)
+
+    async def search_track(self, term, *, limit=None, skip=None):
+        params = {'fuzzyOr': f'title,{term},artistsTitle,{term}', 'limit': limit, 'skip': skip}
+        return await self.request('GET', self.TRACK, params=params)
+
+    async def search_track_advanced(self, title, artists, *, limit=None, skip=None):
+        params = {'fuzzy': f'title,{title},artistsTitle,{artists}', 'limit': limit, 'skip': skip}
+        return await self.request('GET', self.TRACK, params=params)
+
+    async def search_artist(self, term, *, year=None, limit=None, skip=None):
+        params = {
+            'fuzzyOr': f'name,{term},year,{year}' if year else f'name,{term}',
+            'limit': limit,
+            'skip': skip
+        }
+        return await self.request('GET', self.ARTIST, params=params)
+
+    async def search_playlist(self, term, *, limit=None, skip=None):
+        params = {'fuzzyOr': f'name,{term}', 'limit': limit, 'skip': skip}
+        return await self.request('GET', self.PLAYLIST, params=params)
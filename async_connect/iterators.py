@@ -33,14 +33,13 @@ from .http import HTTPClient
 class _AsyncIterator(AsyncIterator):
     def __init__(self, *, http=None, loop=None):
         self.loop = loop
-        self.items = asyncio.Queue(loop=self.loop)
+        self.items = asyncio.Queue()
         self._http = http
         self._request = True
 
     async def __anext__(self):
         if self.items.empty() and self._request:
             await self.request_data()
-            self._request = False
         try:
             value = self.items.get_nowait()
         except asyncio.QueueEmpty:
@@ -49,11 +48,13 @@ class _AsyncIterator(AsyncIterator):
             return value
 
     async def values(self) -> list:
-        await self.request_data()
+        while self._request:
+            await self.request_data()
         return list(self.items._queue)
 
     async def request_data(self):
-        pass
+        # subclasses clear _request once a request succeeds, so a failed one is retried
+        self._request = False
 
 
 class ReleaseIterator(_AsyncIterator):
@@ -67,6 +68,7 @@ class ReleaseIterator(_AsyncIterator):
         for data in (await http.get_release_tracklist(self.id))['results']:
             track = Track(**data)
             self.items.put_nowait(track)
+        self._request = False
         if not self._http:
             await http.close()
 
@@ -82,19 +84,30 @@ class PlaylistIterator(_AsyncIterator):
         for data in (await http.get_playlist_tracklist(self.id))['results']:
             track = PlaylistEntry(**data)
             self.items.put_nowait(track)
+        self._request = False
         if not self._http:
             await http.close()
 
 
 class ArtistIterator(_AsyncIterator):
-    def __init__(self, artist_id: str, *, http=None, loop=None):
+    def __init__(self, artist_id: str, *, page_size: int = None, http=None, loop=None):
         super().__init__(http=http, loop=loop)
         self.id = artist_id
+        self.page_size = page_size
+        self._skip = 0
 
     async def request_data(self):
         from .release import Release
         http = self._http or HTTPClient(loop=self.loop)
-        for data in (await http.get_artist_releases(self.id))['results']:
+        if self.page_size:
+            page = await http.get_artist_releases(self.id, limit=self.page_size, skip=self._skip)
+            self._skip += len(page['results'])
+            # request the next page once this one has been consumed
+            self._request = bool(page['results']) and self._skip < page['total']
+        else:
+            page = await http.get_artist_releases(self.id)
+            self._request = False
+        for data in page['results']:
             release = Release(loop=self.loop, http=self._http, **data)
             self.items.put_nowait(release)
         if not self._http:
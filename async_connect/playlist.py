@@ -46,7 +46,7 @@ class Playlist:
             If the playlist is deleted.
         """
 
-    __slots__ = ('id', 'name', 'owner_id', 'is_public', 'is_deleted', '_tracks', '_loop', '_http')
+    __slots__ = ('id', 'name', 'owner_id', 'is_public', 'is_deleted', '_loop', '_http')
 
     def __init__(self, **kwargs):
         self.id = kwargs.pop('_id')
@@ -59,7 +59,7 @@ class Release:
 
     __slots__ = (
         'id', 'catalog_id', 'artists', 'title', 'release_date', 'type', 'cover_url', 'urls',
-        'is_downloadable', 'is_streamable', 'in_early_access', 'is_free', '_tracks', '_loop', '_http'
+        'is_downloadable', 'is_streamable', 'in_early_access', 'is_free', '_loop', '_http'
     )
 
     def __init__(self, **kwargs):
@@ -107,6 +107,10 @@ class Track:
         """A list of Albums that this track is a part of."""
         return list(self._albums.values())
 
+    def in_release(self, release: Release) -> bool:
+        """Indicates if the track is a part of the given release."""
+        return release.id in self._albums
+
     def get_artists(self) -> List[ArtistEntry]:
         """A list of artists that composed the track."""
         return list(self._artists.values())
@@ -176,7 +180,7 @@ class BrowseEntry(Track):
         Indicates if the track can be downloaded for free.
     """
 
-    __slots__ = ('release', '_albums', '_albums_raw')
+    __slots__ = ('release',)
 
     def __init__(self, **kwargs):
         self.release = Release(**kwargs.pop('release'))
@@ -187,6 +191,9 @@ class BrowseEntry(Track):
     def albums(self):
         return self._albums
 
+    def in_release(self, release: Release) -> bool:
+        return release.id == self._albums.id
+
     def _from_data(self):
         for data in self._artists_raw:
             artist = ArtistEntry(**data)
@@ -24,14 +24,23 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import datetime
 import re
+import warnings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import ujson as json
 except ImportError:
     import json
 
+_TIMESTAMP_SPLIT_RE = re.compile(r'[^\d]')
+
 
 class DownloadLinkGenerator:
     BASE = 'https://connect.monstercat.com'
@@ -60,14 +69,55 @@ class DownloadLinkGenerator:
 
 
 def to_json(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
     if json.__name__ == 'ujson':
         return json.dumps(obj, ensure_ascii=True)
     return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
 
 
+def from_json(data):
+    """Decodes JSON from bytes or str. Raises ValueError if the data is not valid JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def get_running_loop():
+    """Returns the running event loop, or None if there is none running."""
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:
+        # Python 3.6 doesn't have get_running_loop
+        return asyncio._get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_event_loop():
+    """Returns the running event loop, otherwise the current one set on the policy.
+    A new event loop is created and set as the current one only if the policy doesn't have one."""
+    try:
+        return asyncio.get_running_loop()
+    except AttributeError:
+        # Python 3.6 doesn't have get_running_loop
+        return asyncio.get_event_loop()
+    except RuntimeError:
+        pass
+    try:
+        with warnings.catch_warnings():
+            # Python 3.12 and 3.13 warn instead of raising when the policy has to create the loop itself
+            warnings.simplefilter('ignore', DeprecationWarning)
+            return asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        return loop
+
+
 def parse_time(timestamp):
     if timestamp:
-        return datetime.datetime(*map(int, re.split(r'[^\d]', timestamp.replace('Z', ''))))
+        return datetime.datetime(*map(int, _TIMESTAMP_SPLIT_RE.split(timestamp.replace('Z', ''))))
     return None
 
 
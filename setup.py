@@ -3,19 +3,21 @@ import sys
 
 from setuptools import setup, find_packages
 
+VERSION_RE = re.compile(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', re.MULTILINE)
+
 with open('requirements.txt') as f:
     requirements = f.readlines()
 
 with open('async_connect/__init__.py') as f:
-    version = re.search(r'^__version__\s*=\s*[\'"]([^\'"]*)[\'"]', f.read(), re.MULTILINE).group(1)
+    version = VERSION_RE.search(f.read()).group(1)
 
 with open('README.rst') as f:
     readme = f.read()
 
 if sys.version_info[1] == 6:
-    test_require = ['uvloop>=0.8.1', 'ujson>=1.35']
+    test_require = ['uvloop>=0.8.1', 'orjson>=2.0.0', 'ujson>=1.35', 'Brotli>=1.0.0']
 else:
-    test_require = ['ujson>=1.35']
+    test_require = ['orjson>=2.0.0', 'ujson>=1.35', 'Brotli>=1.0.0']
 
 setup(name='async-connect.py',
       author='GiovanniMCMXCIX',
@@ -29,7 +31,7 @@ setup(name='async-connect.py',
       include_package_data=True,
       python_requires='>=3.6.2',
       install_requires=requirements,
-      extras_require={'performance': ['uvloop>=0.8.0', 'ujson>=1.35']},
+      extras_require={'performance': ['uvloop>=0.8.0', 'orjson>=2.0.0', 'ujson>=1.35', 'Brotli>=1.0.0']},
       test_suite='tests',
       tests_require=test_require,
       classifiers=[
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2017 GiovanniMCMXCIX
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import functools
+import sys
+import unittest
+
+import async_connect as connect
+
+
+def async_test(func):
+    """Runs a coroutine test method on the event loop shared by its test case."""
+    @functools.wraps(func)
+    def wrapper(self):
+        self.loop.run_until_complete(func(self))
+    return wrapper
+
+
+class AsyncTestCase(unittest.TestCase):
+    """Test case that shares one event loop and one client between all of its tests."""
+    client_options = {}
+
+    @classmethod
+    def setUpClass(cls):
+        if sys.version_info[1] == 6:
+            import uvloop
+            cls.loop = uvloop.new_event_loop()
+        else:
+            cls.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(cls.loop)
+        cls.connect = connect.Client(loop=cls.loop, **cls.client_options)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.run_until_complete(cls.connect.close())
+        cls.loop.close()
+        asyncio.set_event_loop(None)
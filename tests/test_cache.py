@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""
+MIT License
+
+Copyright (c) 2017 GiovanniMCMXCIX
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+from . import AsyncTestCase, async_test
+
+
+class TestCache(AsyncTestCase):
+    client_options = {'cache_ttl': 60}
+
+    @async_test
+    async def test_cache(self):
+        calls = []
+
+        async def fetch(method, url, **kwargs):
+            calls.append(method)
+            # let the other gathered request join this one before it finishes
+            await asyncio.sleep(0)
+            return {'results': [], 'total': 0}
+
+        http = self.connect.http
+        http._request = fetch
+        try:
+            first, second = await asyncio.gather(http.request('GET', http.RELEASE), http.request('GET', http.RELEASE))
+            self.assertEqual(len(calls), 1)
+            # every caller gets its own copy of the shared response
+            first['results'].append(None)
+            self.assertEqual(second, {'results': [], 'total': 0})
+
+            self.assertEqual(await http.request('GET', http.RELEASE), {'results': [], 'total': 0})
+            self.assertEqual(len(calls), 1)
+
+            await http.request('POST', http.PLAYLIST, json={})
+            await http.request('GET', http.RELEASE)
+            self.assertEqual(calls, ['GET', 'POST', 'GET'])
+        finally:
+            del http._request
@@ -24,56 +24,38 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import sys
-import unittest
-
-import async_connect as connect
-
-
-class TestGetAllCatalog(unittest.TestCase):
-    def setUp(self):
-        if sys.version_info[1] == 6:
-            import asyncio
-            import uvloop
-            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-            self.loop = asyncio.get_event_loop()
-            self.connect = connect.Client(loop=self.loop)
-        else:
-            self.connect = connect.Client()
-            self.loop = self.connect.loop
-
-    def test_release(self):
-        async def test():
-            print('\n[connect.Client.get_all_releases]')
-            releases = []
-            data = await self.connect.get_all_releases()
-            for release in data:
-                releases.append((str(release), len(await release.tracks.values())))
-            print(f'There are {len(releases)} total releases.')
-
-        self.loop.run_until_complete(test())
-
-    def test_track(self):
-        async def test():
-            print('\n[connect.Client.get_all_tracks]')
-            tracks = []
-            data = await self.connect.get_all_tracks()
-            for track in data:
-                tracks.append((str(track), len(track.albums)))
-            print(f'There are {len(tracks)} total tracks.')
-
-        self.loop.run_until_complete(test())
-
-    def test_artist(self):
-        async def test():
-            print('\n[connect.Client.get_all_artists]')
-            artists = []
-            data = await self.connect.get_all_artists()
-            for artist in data:
-                artists.append((str(artist), len(await artist.releases.values())))
-            print(f'There are {len(artists)} total artists.')
-
-        self.loop.run_until_complete(test())
-
-    def tearDown(self):
-        self.loop.run_until_complete(self.connect.close())
+import asyncio
+
+from . import AsyncTestCase, async_test
+
+
+class TestGetAllCatalog(AsyncTestCase):
+    @async_test
+    async def test_release(self):
+        print('\n[connect.Client.get_all_releases]')
+        data = await self.connect.get_all_releases_with_tracks()
+        releases = [(str(release), len(tracks)) for release, tracks in data]
+        print(f'There are {len(releases)} total releases.')
+
+    @async_test
+    async def test_track(self):
+        print('\n[connect.Client.get_all_tracks]')
+        data = await self.connect.get_all_tracks()
+        tracks = [(str(track), len(track.albums)) for track in data]
+        print(f'There are {len(tracks)} total tracks.')
+
+    @async_test
+    async def test_artist(self):
+        print('\n[connect.Client.get_all_artists]')
+        data = await self.connect.get_all_artists()
+        discographies = await asyncio.gather(*[artist.releases.values() for artist in data])
+        artists = [(str(artist), len(releases)) for artist, releases in zip(data, discographies)]
+        print(f'There are {len(artists)} total artists.')
+
+    @async_test
+    async def test_paged(self):
+        print('\n[connect.Client.get_all_tracks(page_size=...)]')
+        data, paged = await asyncio.gather(self.connect.get_all_tracks(), self.connect.get_all_tracks(page_size=100))
+        self.assertEqual(len(paged), len(data))
+        self.assertEqual([track.id for track in paged], [track.id for track in data])
+        print(f'Fetched {len(paged)} tracks in pages of 100.')
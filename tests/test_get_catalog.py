@@ -24,66 +24,66 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-import sys
-import unittest
-
-import async_connect as connect
-
-
-class TestGetAllCatalog(unittest.TestCase):
-    def setUp(self):
-        if sys.version_info[1] == 6:
-            import asyncio
-            import uvloop
-            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-            self.loop = asyncio.get_event_loop()
-            self.connect = connect.Client(loop=self.loop)
-        else:
-            self.connect = connect.Client()
-            self.loop = self.connect.loop
-
-    def test_release(self):
-        async def test():
-            release = await self.connect.get_release('MC011')
-            print(f'\n[connect.Client.get_release]\n{release.title} by {release.artists} had been release on {release.release_date} and has the following track(s):')
-            print('\n'.join([f'{track.title} by {track.artists}' async for track in release.tracks]))
-
-        self.loop.run_until_complete(test())
-
-    def test_playlist(self):
-        async def test():
-            playlist = await self.connect.get_playlist('577ec5395891d31a15b80c39')
-            print(f'\n[connect.Client.get_playlist]\nThe playlist with the name {playlist} has the following tracks:')
-            async for track in playlist.tracks:
-                print(f'[{track.release.catalog_id}] {track.title} by {track.artists} from {track.release.title}')
-
-        self.loop.run_until_complete(test())
-
-    def test_track(self):
-        async def test():
-            track = await self.connect.get_track('512bdb6db9a8860a11000029')
-            print(f'\n[connect.Client.get_track]\n{track.title} by {track.artists} has been featured on the following releases:')
-            self.assertEqual(track.artists, str(await self.connect.get_artist(track.get_artists()[0].id)))
-            release = await self.connect.get_release('MC011')
-            self.assertEqual([album.id for album in track.albums if album.id == release.id][0], release.id)
-            for album in track.albums:
-                print('[{0.catalog_id}] {0.title}'.format(await self.connect.get_release(album.id)))
-
-        self.loop.run_until_complete(test())
-
-    def test_artist(self):
-        async def test():
-            artist = await self.connect.get_artist('gq')
-            print(f'\n[connect.connect.get_artist]\n{artist}, is featured on the year(s) {", ".join(str(year) for year in artist.years)} and has released the following:')
-            for release in await artist.releases.values():
-                if not release.artists.lower() == 'various artists':
-                    print('[{0.catalog_id}] {0.title} with {1} track(s)'.format(release, len(await release.tracks.values())))
-            print("And appears on:")
-            async for release in artist.releases:
-                if release.artists.lower() == 'various artists':
-                    print(f'[{release.catalog_id}] {release.title}')
-
-        self.loop.run_until_complete(test())
-
-    def tearDown(self):
-        self.loop.run_until_complete(self.connect.close())
+import asyncio
+
+from . import AsyncTestCase, async_test
+
+
+class TestGetAllCatalog(AsyncTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # prefetch the release that several tests need, it is fetched while the loop runs the first test
+        cls.prefetch = cls.loop.create_task(cls.connect.get_release('MC011'))
+
+    @classmethod
+    def tearDownClass(cls):
+        # collect the prefetch even if no test awaited it, so its result or error isn't left dangling
+        cls.loop.run_until_complete(asyncio.gather(cls.prefetch, return_exceptions=True))
+        super().tearDownClass()
+
+    async def _release(self):
+        release = await self.prefetch
+        print(f'\n[connect.Client.get_release]\n{release.title} by {release.artists} had been release on {release.release_date} and has the following track(s):')
+        print('\n'.join([f'{track.title} by {track.artists}' async for track in release.tracks]))
+
+    test_release = async_test(_release)
+
+    async def _playlist(self):
+        playlist = await self.connect.get_playlist('577ec5395891d31a15b80c39')
+        print(f'\n[connect.Client.get_playlist]\nThe playlist with the name {playlist} has the following tracks:')
+        tracks = await playlist.tracks.values()
+        print('\n'.join(f'[{track.release.catalog_id}] {track.title} by {track.artists} from {track.release.title}' for track in tracks))
+
+    test_playlist = async_test(_playlist)
+
+    async def _track(self):
+        track = await self.connect.get_track('512bdb6db9a8860a11000029')
+        print(f'\n[connect.Client.get_track]\n{track.title} by {track.artists} has been featured on the following releases:')
+        artist, release = await asyncio.gather(self.connect.get_artist(track.get_artists()[0].id), self.prefetch)
+        self.assertEqual(track.artists, str(artist))
+        self.assertEqual([album.id for album in track.albums if album.id == release.id][0], release.id)
+        releases = await self.connect.get_releases([album.id for album in track.albums])
+        print('\n'.join(f'[{album.catalog_id}] {album.title}' for album in releases.values()))
+
+    test_track = async_test(_track)
+
+    async def _artist(self):
+        artist = await self.connect.get_artist('gq')
+        print(f'\n[connect.connect.get_artist]\n{artist}, is featured on the year(s) {", ".join(str(year) for year in artist.years)} and has released the following:')
+        own, various = [], []
+        async for release in artist.iter_releases():
+            (various if release.artists.lower() == 'various artists' else own).append(release)
+        tracklists = await asyncio.gather(*[release.tracks.values() for release in own])
+        for release, tracks in zip(own, tracklists):
+            print(f'[{release.catalog_id}] {release.title} with {len(tracks)} track(s)')
+        print("And appears on:")
+        for release in various:
+            print(f'[{release.catalog_id}] {release.title}')
+
+    test_artist = async_test(_artist)
+
+    @async_test
+    async def test_all_parallel(self):
+        # the four tests are independent, so their requests can share the connection pool at the same time
+        await asyncio.gather(self._release(), self._playlist(), self._track(), self._artist())